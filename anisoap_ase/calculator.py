@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import numpy as np
@@ -14,11 +17,26 @@ from ase.calculators.calculator import (
 )
 
 from .descriptors import AniSOAPDescriptor
-from .model import evaluate_model
+from .model import LinearModel, evaluate_model
 
 Descriptor = Callable[[Atoms], Any]
 
 
+def _structure_key(atoms: Atoms) -> bytes:
+    """Digest everything that can influence a descriptor for one structure."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(atoms.numbers).tobytes())
+    digest.update(np.ascontiguousarray(atoms.positions, dtype=float).tobytes())
+    digest.update(np.ascontiguousarray(atoms.cell[:], dtype=float).tobytes())
+    digest.update(np.ascontiguousarray(atoms.pbc).tobytes())
+    for name in sorted(atoms.arrays):
+        if name in ("numbers", "positions"):
+            continue
+        digest.update(name.encode())
+        digest.update(np.ascontiguousarray(atoms.arrays[name]).tobytes())
+    return digest.digest()
+
+
 class AniSOAPCalculator(Calculator):
     """Connect an AniSOAP descriptor and scalar energy model to ASE.
 
@@ -29,6 +47,7 @@ class AniSOAPCalculator(Calculator):
     """
 
     implemented_properties = ["energy", "forces"]
+    _implemented = frozenset(implemented_properties)
 
     def __init__(
         self,
@@ -37,6 +56,8 @@ class AniSOAPCalculator(Calculator):
         *,
         force_method: str | None = None,
         finite_difference_step: float = 1e-4,
+        max_workers: int | None = None,
+        descriptor_cache_size: int = 0,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -46,32 +67,273 @@ class AniSOAPCalculator(Calculator):
             raise ValueError("force_method must be None or 'central'.")
         if not np.isfinite(finite_difference_step) or finite_difference_step <= 0:
             raise ValueError("finite_difference_step must be positive and finite.")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        if descriptor_cache_size < 0:
+            raise ValueError("descriptor_cache_size must be non-negative.")
 
         self.model = model
         self.descriptor = descriptor if descriptor is not None else AniSOAPDescriptor()
         self.force_method = force_method
         self.finite_difference_step = float(finite_difference_step)
+        self.max_workers = max_workers
+        self.descriptor_cache_size = descriptor_cache_size
+        self._descriptor_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+
+        # Linear models reduce to one dot product; cache their parameters as
+        # contiguous float64 arrays so the per-step path skips model dispatch.
+        if isinstance(model, LinearModel):
+            self._linear_coefficients = np.ascontiguousarray(
+                model.coefficients, dtype=float
+            )
+            self._linear_intercept = float(model.intercept)
+        else:
+            self._linear_coefficients = None
+            self._linear_intercept = 0.0
+
+    def _check_properties(self, properties: Iterable[str]) -> set[str]:
+        """Validate requested ASE properties once per call, not per branch."""
+        requested = set(properties)
+        unsupported = requested.difference(self._implemented)
+        if unsupported:
+            names = ", ".join(sorted(unsupported))
+            raise PropertyNotImplementedError(f"Unsupported ASE properties: {names}")
+        if "forces" in requested and self.force_method is None:
+            raise PropertyNotImplementedError(
+                "Forces are disabled. Set force_method='central' to enable "
+                "finite-difference forces."
+            )
+        return requested
+
+    def _features(self, atoms: Atoms) -> np.ndarray:
+        """Return the feature vector, reusing cached results when enabled.
+
+        With ``descriptor_cache_size`` above zero, feature vectors are kept in
+        a bounded least-recently-used cache keyed on a digest of everything
+        the descriptor can see (numbers, positions, cell, periodicity, and
+        per-atom arrays such as orientations and diameters), so revisited
+        geometries — restart frames, duplicate trajectory snapshots — skip
+        the descriptor computation entirely.
+        """
+        if self.descriptor_cache_size == 0:
+            return np.ascontiguousarray(self.descriptor(atoms), dtype=float).reshape(
+                -1
+            )
+
+        key = _structure_key(atoms)
+        cache = self._descriptor_cache
+        features = cache.get(key)
+        if features is None:
+            features = np.ascontiguousarray(
+                self.descriptor(atoms), dtype=float
+            ).reshape(-1)
+            # The buffer is shared with every future cache hit; freeze it so
+            # a model editing its input in place fails instead of corrupting
+            # the cache.
+            features.setflags(write=False)
+            cache[key] = features
+            if len(cache) > self.descriptor_cache_size:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return features
 
     def _evaluate_energy(self, atoms: Atoms) -> float:
-        features = np.asarray(self.descriptor(atoms), dtype=float).reshape(-1)
+        features = self._features(atoms)
+        if self._linear_coefficients is not None:
+            if features.shape == self._linear_coefficients.shape:
+                energy = float(features @ self._linear_coefficients) + (
+                    self._linear_intercept
+                )
+                if not np.isfinite(energy):
+                    self._raise_non_finite(features)
+                return energy
+            # Let the model raise its canonical feature-length error.
+            return self.model(features)
         return evaluate_model(self.model, features)
 
-    def _central_forces(self, atoms: Atoms) -> np.ndarray:
-        step = self.finite_difference_step
-        forces = np.empty((len(atoms), 3), dtype=float)
+    @staticmethod
+    def _raise_non_finite(features: np.ndarray) -> None:
+        """Raise the same error evaluate_model would for non-finite inputs."""
+        if not np.all(np.isfinite(features)):
+            raise ValueError("Descriptor returned non-finite values.")
+        raise ValueError("Energy model returned a non-finite value.")
+
+    def _features_batch(self, frames: Sequence[Atoms]) -> np.ndarray:
+        """Stack feature vectors for several structures into one matrix.
+
+        With ``max_workers`` set, the batch is split into contiguous chunks
+        evaluated concurrently; NumPy releases the GIL inside the heavy
+        descriptor work, so independent frames overlap on multiple cores.
+        """
+        workers = self.max_workers
+        if workers is not None and workers > 1 and len(frames) > 1:
+            chunk_count = min(workers, len(frames))
+            bounds = np.linspace(0, len(frames), chunk_count + 1).astype(int)
+            chunks = [
+                frames[start:stop]
+                for start, stop in zip(bounds[:-1], bounds[1:], strict=True)
+            ]
+            # The first chunk is evaluated up front to size the output; the
+            # remaining chunks then fill disjoint row views of one buffer, so
+            # no per-chunk arrays are concatenated afterwards.
+            first = self._features_chunk(chunks[0])
+            out = np.empty((len(frames), first.shape[1]), dtype=float)
+            out[: first.shape[0]] = first
+            offset = first.shape[0]
+            with ThreadPoolExecutor(max_workers=chunk_count - 1) as pool:
+                futures = []
+                for chunk in chunks[1:]:
+                    view = out[offset : offset + len(chunk)]
+                    futures.append(pool.submit(self._features_chunk, chunk, view))
+                    offset += len(chunk)
+                for future in futures:
+                    future.result()
+            return out
+        return self._features_chunk(frames)
+
+    def _features_chunk(
+        self, frames: Sequence[Atoms], out: np.ndarray | None = None
+    ) -> np.ndarray:
+        compute_batch = getattr(self.descriptor, "compute_batch", None)
+        if compute_batch is not None:
+            features = np.asarray(compute_batch(frames), dtype=float)
+            if out is None:
+                return features
+            out[:] = features
+            return out
+
+        for index, frame in enumerate(frames):
+            row = np.asarray(self.descriptor(frame), dtype=float).reshape(-1)
+            if out is None:
+                out = np.empty((len(frames), row.size), dtype=float)
+            if row.size != out.shape[1]:
+                raise ValueError(
+                    "Descriptor returned feature vectors of inconsistent length "
+                    f"across the batch: expected {out.shape[1]}, "
+                    f"received {row.size}."
+                )
+            out[index] = row
+        return out
+
+    def _energies_from_features(self, features: np.ndarray) -> np.ndarray:
+        """Evaluate the model on each row of a feature matrix."""
+        if self._linear_coefficients is not None:
+            energies = self.model.evaluate_batch(features)
+            if not np.all(np.isfinite(energies)):
+                self._raise_non_finite(features)
+            return energies
+        return np.array(
+            [evaluate_model(self.model, row) for row in features], dtype=float
+        )
+
+    def energies(self, atoms_list: Sequence[Atoms]) -> np.ndarray:
+        """Return potential energies for a list of structures in one pass.
+
+        Descriptors for the whole batch are computed with a single backend
+        call when the descriptor supports it, and linear models are applied
+        as one matrix product instead of one prediction per frame.
+        """
+        if len(atoms_list) == 0:
+            return np.empty(0, dtype=float)
+        return self._energies_from_features(self._features_batch(atoms_list))
 
+    def calculate_batch(
+        self,
+        atoms_list: Sequence[Atoms],
+        properties: Iterable[str] = ("energy",),
+    ) -> list[dict[str, Any]]:
+        """Evaluate several structures at once, amortizing descriptor setup.
+
+        Returns one ``results``-shaped dictionary per structure. The
+        calculator's own ``results`` attribute is left untouched.
+        """
+        requested = self._check_properties(properties)
+        if len(atoms_list) == 0:
+            return []
+
+        energies = self.energies(atoms_list)
+        results = [{"energy": float(energy)} for energy in energies]
+        if "forces" in requested:
+            forces = self._central_forces_batch(atoms_list)
+            for frame_results, frame_forces in zip(results, forces, strict=True):
+                frame_results["forces"] = frame_forces
+        return results
+
+    def _perturbed_frames(self, atoms: Atoms) -> list[Atoms]:
+        """Materialize the 6N displaced copies for central differences."""
+        step = self.finite_difference_step
+        perturbed = []
         for atom_index in range(len(atoms)):
             for axis in range(3):
-                plus = atoms.copy()
-                minus = atoms.copy()
-                plus.calc = None
-                minus.calc = None
-                plus.positions[atom_index, axis] += step
-                minus.positions[atom_index, axis] -= step
-                energy_plus = self._evaluate_energy(plus)
-                energy_minus = self._evaluate_energy(minus)
-                forces[atom_index, axis] = -(energy_plus - energy_minus) / (2 * step)
+                for offset in (step, -step):
+                    frame = atoms.copy()
+                    frame.calc = None
+                    frame.positions[atom_index, axis] += offset
+                    perturbed.append(frame)
+        return perturbed
+
+    def _central_forces(self, atoms: Atoms) -> np.ndarray:
+        step = self.finite_difference_step
+        atom_count = len(atoms)
+
+        if getattr(self.descriptor, "compute_batch", None) is not None:
+            # Batch-capable descriptors need all perturbed frames alive for
+            # the single backend call, so materialize them.
+            features = self._features_batch(self._perturbed_frames(atoms))
+        else:
+            # Plain callables are evaluated one frame at a time anyway, so a
+            # single scratch copy with one mutated coordinate per evaluation
+            # replaces 6N full Atoms copies.
+            scratch = atoms.copy()
+            scratch.calc = None
+            positions = scratch.positions
+            features = None
+            row_index = 0
+            for atom_index in range(atom_count):
+                for axis in range(3):
+                    original = positions[atom_index, axis]
+                    for offset in (step, -step):
+                        positions[atom_index, axis] = original + offset
+                        row = np.asarray(
+                            self.descriptor(scratch), dtype=float
+                        ).reshape(-1)
+                        if features is None:
+                            features = np.empty(
+                                (6 * atom_count, row.size), dtype=float
+                            )
+                        features[row_index] = row
+                        row_index += 1
+                    positions[atom_index, axis] = original
+
+        energies = self._energies_from_features(features)
+        energies = energies.reshape(atom_count, 3, 2)
+        return -(energies[..., 0] - energies[..., 1]) / (2 * step)
+
+    def _central_forces_batch(self, atoms_list: Sequence[Atoms]) -> list[np.ndarray]:
+        """Compute finite-difference forces for several structures at once.
 
+        For batch-capable descriptors, the perturbations of every frame are
+        concatenated into one descriptor call, so a whole trajectory's force
+        evaluation pays backend setup once instead of once per frame.
+        """
+        if getattr(self.descriptor, "compute_batch", None) is None:
+            return [self._central_forces(atoms) for atoms in atoms_list]
+
+        step = self.finite_difference_step
+        perturbed: list[Atoms] = []
+        counts = []
+        for atoms in atoms_list:
+            counts.append(len(atoms))
+            perturbed.extend(self._perturbed_frames(atoms))
+
+        energies = self._energies_from_features(self._features_batch(perturbed))
+        forces = []
+        start = 0
+        for count in counts:
+            block = energies[start : start + 6 * count].reshape(count, 3, 2)
+            forces.append(-(block[..., 0] - block[..., 1]) / (2 * step))
+            start += 6 * count
         return forces
 
     def calculate(
@@ -80,20 +342,17 @@ class AniSOAPCalculator(Calculator):
         properties: Iterable[str] = ("energy",),
         system_changes: Iterable[str] = all_changes,
     ) -> None:
-        requested = set(properties)
-        unsupported = requested.difference(self.implemented_properties)
-        if unsupported:
-            names = ", ".join(sorted(unsupported))
-            raise PropertyNotImplementedError(f"Unsupported ASE properties: {names}")
-        if "forces" in requested and self.force_method is None:
-            raise PropertyNotImplementedError(
-                "Forces are disabled. Set force_method='central' to enable "
-                "finite-difference forces."
-            )
+        requested = self._check_properties(properties)
 
         if atoms is None and self.atoms is None:
             raise ValueError("AniSOAPCalculator requires an ASE Atoms object.")
 
+        # ASE reports what changed since the previous call; with nothing
+        # changed and every requested property already computed, the cached
+        # results can be reused without touching positions at all.
+        if not set(system_changes) and requested.issubset(self.results):
+            return
+
         super().calculate(atoms, properties, system_changes)
         working_atoms = self.atoms
         if working_atoms is None:
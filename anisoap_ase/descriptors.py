@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import threading
+import weakref
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -24,6 +26,14 @@ DEFAULT_HYPERS: dict[str, Any] = {
 
 _DIAMETER_KEYS = ("c_diameter[1]", "c_diameter[2]", "c_diameter[3]")
 
+# Projections precompute basis and orthogonalization tables, so instances
+# built from identical hypers are shared process-wide. Each cached projection
+# carries a lock serializing power_spectrum calls: upstream does not document
+# that projections are re-entrant, and a shared instance may be driven from
+# several worker threads at once.
+_projection_cache: dict[tuple[tuple[str, Any], ...], tuple[Any, threading.Lock]] = {}
+_projection_lock = threading.Lock()
+
 
 @dataclass
 class AniSOAPDescriptor:
@@ -31,7 +41,15 @@ class AniSOAPDescriptor:
 
     hypers: Mapping[str, Any] = field(default_factory=lambda: dict(DEFAULT_HYPERS))
     default_diameters: tuple[float, float, float] | None = None
+    validate_once: bool = False
     _projection: Any = field(default=None, init=False, repr=False)
+    _projection_use_lock: threading.Lock | None = field(
+        default=None, init=False, repr=False
+    )
+    _diameter_cache: dict[int, dict[str, np.ndarray]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _validated_ids: set[int] = field(default_factory=set, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.hypers = dict(self.hypers)
@@ -48,7 +66,14 @@ class AniSOAPDescriptor:
         return str(self.hypers.get("rotation_key", "c_q"))
 
     def prepare_atoms(self, atoms: Atoms) -> Atoms:
-        """Validate ellipsoidal metadata on a copy of an ASE structure."""
+        """Validate ellipsoidal metadata on a copy of an ASE structure.
+
+        With ``validate_once`` enabled, the full value checks run only the
+        first time a given ``Atoms`` object is seen; repeated calls for the
+        same object (MD steps, finite-difference perturbation sources) skip
+        them. Structural preparation — copying and attaching default
+        diameters — always happens.
+        """
         prepared = atoms.copy()
         atom_count = len(prepared)
 
@@ -58,6 +83,26 @@ class AniSOAPDescriptor:
                 f"'{self.orientation_key}'."
             )
 
+        missing = [key for key in _DIAMETER_KEYS if key not in prepared.arrays]
+        if missing:
+            if self.default_diameters is None:
+                joined = ", ".join(missing)
+                raise ValueError(
+                    "AniSOAP requires ellipsoid diameters. Missing arrays: " + joined
+                )
+            defaults = self._default_diameter_arrays(atom_count)
+            for key in missing:
+                prepared.arrays[key] = defaults[key]
+
+        if not self.validate_once or id(atoms) not in self._validated_ids:
+            self._validate_values(prepared, atom_count)
+            if self.validate_once:
+                self._validated_ids.add(id(atoms))
+                weakref.finalize(atoms, self._validated_ids.discard, id(atoms))
+
+        return prepared
+
+    def _validate_values(self, prepared: Atoms, atom_count: int) -> None:
         orientations = np.asarray(prepared.arrays[self.orientation_key], dtype=float)
         if orientations.shape != (atom_count, 4):
             raise ValueError(
@@ -69,19 +114,6 @@ class AniSOAPDescriptor:
         if np.any(np.linalg.norm(orientations, axis=1) == 0):
             raise ValueError(f"'{self.orientation_key}' contains a zero quaternion.")
 
-        missing = [key for key in _DIAMETER_KEYS if key not in prepared.arrays]
-        if missing:
-            if self.default_diameters is None:
-                joined = ", ".join(missing)
-                raise ValueError(
-                    "AniSOAP requires ellipsoid diameters. Missing arrays: " + joined
-                )
-            defaults = dict(zip(_DIAMETER_KEYS, self.default_diameters, strict=True))
-            for key in missing:
-                prepared.set_array(
-                    key, np.full(atom_count, defaults[key], dtype=float)
-                )
-
         for key in _DIAMETER_KEYS:
             values = np.asarray(prepared.arrays[key], dtype=float)
             if values.shape != (atom_count,):
@@ -91,7 +123,27 @@ class AniSOAPDescriptor:
             if not np.all(np.isfinite(values)) or np.any(values <= 0):
                 raise ValueError(f"'{key}' must contain positive finite values.")
 
-        return prepared
+    def _default_diameter_arrays(self, atom_count: int) -> dict[str, np.ndarray]:
+        """Return shared, read-only default-diameter arrays for one system size.
+
+        Repeated calls for the same number of atoms (every MD step, every
+        finite-difference perturbation) reuse one set of buffers instead of
+        allocating three fresh arrays per call. The arrays are marked
+        read-only because they are shared across prepared structures.
+        """
+        if self.default_diameters is None:
+            raise ValueError("No default diameters were configured.")
+        cached = self._diameter_cache.get(atom_count)
+        if cached is None:
+            cached = {}
+            for key, value in zip(
+                _DIAMETER_KEYS, self.default_diameters, strict=True
+            ):
+                array = np.full(atom_count, value, dtype=float)
+                array.setflags(write=False)
+                cached[key] = array
+            self._diameter_cache[atom_count] = cached
+        return cached
 
     def _get_projection(self) -> Any:
         if self._projection is None:
@@ -102,12 +154,42 @@ class AniSOAPDescriptor:
                     "AniSOAP is required for the default descriptor. Install the "
                     "pinned upstream dependency with 'bash scripts/bootstrap.sh'."
                 ) from exc
-            self._projection = EllipsoidalDensityProjection(**self.hypers)
+            try:
+                key = tuple(sorted(self.hypers.items()))
+                hash(key)
+            except TypeError:
+                # Unhashable hyper values: fall back to a private projection.
+                # It still needs a use lock — one descriptor instance can be
+                # driven from several threads.
+                projection = EllipsoidalDensityProjection(**self.hypers)
+                # Publish the lock before the projection: the fast path above
+                # only checks _projection, so it must never see the pair
+                # half-initialized.
+                self._projection_use_lock = threading.Lock()
+                self._projection = projection
+                return projection
+            with _projection_lock:
+                entry = _projection_cache.get(key)
+                if entry is None:
+                    entry = (
+                        EllipsoidalDensityProjection(**self.hypers),
+                        threading.Lock(),
+                    )
+                    _projection_cache[key] = entry
+            projection, use_lock = entry
+            self._projection_use_lock = use_lock
+            self._projection = projection
         return self._projection
 
+    def _power_spectrum(self, prepared: list[Atoms]) -> Any:
+        """Call the backend with exclusive use of the (shared) projection."""
+        projection = self._get_projection()
+        with self._projection_use_lock:
+            return projection.power_spectrum(prepared)
+
     def __call__(self, atoms: Atoms) -> np.ndarray:
         prepared = self.prepare_atoms(atoms)
-        output = self._get_projection().power_spectrum([prepared])
+        output = self._power_spectrum([prepared])
         first = output[0]
         values = getattr(first, "values", first)
         features = np.asarray(values, dtype=float).reshape(-1)
@@ -116,3 +198,22 @@ class AniSOAPDescriptor:
         if not np.all(np.isfinite(features)):
             raise ValueError("AniSOAP returned non-finite descriptor values.")
         return features
+
+    def compute_batch(self, frames: Sequence[Atoms]) -> np.ndarray:
+        """Compute descriptors for several structures with one AniSOAP call.
+
+        Basis precomputation and block assembly inside AniSOAP happen once for
+        the whole batch instead of once per frame. Returns an array of shape
+        ``(len(frames), n_features)``.
+        """
+        if len(frames) == 0:
+            raise ValueError("compute_batch requires at least one structure.")
+        prepared = [self.prepare_atoms(atoms) for atoms in frames]
+        output = self._power_spectrum(prepared)
+        values = getattr(output, "values", output)
+        features = np.asarray(values, dtype=float).reshape(len(frames), -1)
+        if features.shape[1] == 0:
+            raise ValueError("AniSOAP returned an empty descriptor.")
+        if not np.all(np.isfinite(features)):
+            raise ValueError("AniSOAP returned non-finite descriptor values.")
+        return features
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+_load_cache: dict[tuple[str, int], LinearModel] = {}
+_load_lock = threading.Lock()
+
+
+def clear_model_cache() -> None:
+    """Forget models memoized by :meth:`LinearModel.load`."""
+    with _load_lock:
+        _load_cache.clear()
+
 
 def evaluate_model(model: Any, features: np.ndarray) -> float:
     """Evaluate a callable or scikit-learn-style model on one feature vector."""
@@ -24,13 +34,13 @@ def evaluate_model(model: Any, features: np.ndarray) -> float:
     else:
         raise TypeError("model must be callable or expose a predict method.")
 
-    values = np.asarray(raw_energy, dtype=float).reshape(-1)
+    values = np.asarray(raw_energy, dtype=float)
     if values.size != 1:
         raise ValueError(
             "Energy model must return exactly one scalar for a single ASE structure."
         )
 
-    energy = float(values[0])
+    energy = values.item()
     if not np.isfinite(energy):
         raise ValueError("Energy model returned a non-finite value.")
     return energy
@@ -63,6 +73,20 @@ class LinearModel:
             )
         return float(vector @ self.coefficients + self.intercept)
 
+    def evaluate_batch(self, features: np.ndarray) -> np.ndarray:
+        """Evaluate the model on each row of a feature matrix.
+
+        One matrix-vector product replaces per-frame calls, so scoring a
+        trajectory pays Python dispatch once instead of once per frame.
+        """
+        matrix = np.asarray(features, dtype=float)
+        if matrix.ndim != 2 or matrix.shape[1] != self.coefficients.size:
+            raise ValueError(
+                "evaluate_batch expects a feature matrix of shape "
+                f"(n_frames, {self.coefficients.size}); received {matrix.shape}."
+            )
+        return matrix @ self.coefficients + self.intercept
+
     def save(self, path: str | Path) -> None:
         """Store model parameters in NumPy's non-executable NPZ format."""
         np.savez(
@@ -73,9 +97,28 @@ class LinearModel:
 
     @classmethod
     def load(cls, path: str | Path) -> LinearModel:
-        """Load model parameters written by :meth:`save`."""
-        with np.load(Path(path), allow_pickle=False) as data:
-            return cls(
+        """Load model parameters written by :meth:`save`.
+
+        Loads are memoized per resolved path and file modification time, so
+        constructing one calculator per frame reads the parameter file from
+        disk once. Rewriting the file invalidates the cached entry; tests
+        wanting full isolation can call :func:`clear_model_cache`.
+        """
+        resolved = Path(path).resolve()
+        key = (str(resolved), resolved.stat().st_mtime_ns)
+        with _load_lock:
+            cached = _load_cache.get(key)
+        if cached is not None:
+            return cached
+
+        with np.load(resolved, allow_pickle=False) as data:
+            model = cls(
                 coefficients=np.asarray(data["coefficients"], dtype=float),
                 intercept=float(np.asarray(data["intercept"]).reshape(-1)[0]),
             )
+        # The instance is shared by every caller of load(); freeze the
+        # coefficient buffer so in-place edits fail instead of corrupting it.
+        model.coefficients.setflags(write=False)
+        with _load_lock:
+            _load_cache[key] = model
+        return model
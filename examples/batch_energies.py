@@ -0,0 +1,28 @@
+"""Score a list of frames in one batched, optionally threaded pass."""
+
+import numpy as np
+from ase import Atoms
+
+from anisoap_ase import AniSOAPCalculator
+
+
+def position_descriptor(atoms: Atoms) -> np.ndarray:
+    return atoms.get_positions().reshape(-1)
+
+
+def harmonic_energy(features: np.ndarray) -> float:
+    return 0.5 * float(features @ features)
+
+
+frames = [
+    Atoms("H2", positions=[[0.5 + 0.05 * step, 0.0, 0.0], [-0.5, 0.0, 0.0]])
+    for step in range(8)
+]
+
+calc = AniSOAPCalculator(
+    descriptor=position_descriptor,
+    model=harmonic_energy,
+    max_workers=4,
+)
+
+print("Energies (eV):", calc.energies(frames))
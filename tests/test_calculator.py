@@ -71,6 +71,235 @@ def test_sklearn_style_predict_interface() -> None:
     assert atoms.get_potential_energy() == pytest.approx(6.0)
 
 
+def test_empty_system_changes_reuses_cached_results() -> None:
+    calls = 0
+
+    def descriptor(atoms: Atoms) -> np.ndarray:
+        nonlocal calls
+        calls += 1
+        return atoms.get_positions().reshape(-1)
+
+    atoms = Atoms("He", positions=[[0.1, 0.2, 0.3]])
+    calc = AniSOAPCalculator(model=harmonic_energy, descriptor=descriptor)
+    calc.calculate(atoms, properties=["energy"], system_changes=["positions"])
+    calc.calculate(atoms, properties=["energy"], system_changes=[])
+    assert calls == 1
+
+
+def test_energies_match_per_frame_evaluation() -> None:
+    frames = [
+        Atoms("H", positions=[[1.0, 0.0, 0.0]]),
+        Atoms("H", positions=[[0.0, 2.0, 0.0]]),
+        Atoms("H", positions=[[0.0, 0.0, 3.0]]),
+    ]
+    calc = AniSOAPCalculator(model=harmonic_energy, descriptor=position_descriptor)
+    np.testing.assert_allclose(calc.energies(frames), [0.5, 2.0, 4.5])
+
+
+def test_energies_use_one_linear_matrix_product() -> None:
+    from anisoap_ase import LinearModel
+
+    model = LinearModel(np.array([1.0, 2.0, 3.0]), intercept=0.5)
+    calc = AniSOAPCalculator(model=model, descriptor=position_descriptor)
+    frames = [
+        Atoms("H", positions=[[1.0, 1.0, 1.0]]),
+        Atoms("H", positions=[[2.0, 0.0, 0.0]]),
+    ]
+    np.testing.assert_allclose(calc.energies(frames), [6.5, 2.5])
+
+
+def test_linear_model_fast_path_matches_direct_call() -> None:
+    from anisoap_ase import LinearModel
+
+    model = LinearModel(np.array([0.5, -1.0, 2.0]), intercept=-0.25)
+    atoms = Atoms("H", positions=[[1.0, 2.0, 3.0]])
+    atoms.calc = AniSOAPCalculator(model=model, descriptor=position_descriptor)
+    assert atoms.get_potential_energy() == pytest.approx(
+        model(position_descriptor(atoms))
+    )
+
+
+def test_linear_model_fast_path_rejects_non_finite_descriptor() -> None:
+    from anisoap_ase import LinearModel
+
+    atoms = Atoms("H", positions=[[0.0, 0.0, 0.0]])
+    atoms.calc = AniSOAPCalculator(
+        model=LinearModel(np.array([1.0])),
+        descriptor=lambda _: np.array([np.nan]),
+    )
+    with pytest.raises(ValueError, match="non-finite values"):
+        atoms.get_potential_energy()
+
+
+def test_linear_model_fast_path_keeps_length_validation() -> None:
+    from anisoap_ase import LinearModel
+
+    atoms = Atoms("H", positions=[[0.0, 0.0, 0.0]])
+    atoms.calc = AniSOAPCalculator(
+        model=LinearModel(np.array([1.0, 2.0])), descriptor=position_descriptor
+    )
+    with pytest.raises(ValueError, match="Feature length"):
+        atoms.get_potential_energy()
+
+
+def test_batch_linear_energies_reject_non_finite_descriptors() -> None:
+    from anisoap_ase import LinearModel
+
+    calc = AniSOAPCalculator(
+        model=LinearModel(np.array([1.0])),
+        descriptor=lambda _: np.array([np.nan]),
+    )
+    frames = [Atoms("H", positions=[[0.0, 0.0, 0.0]]) for _ in range(2)]
+    with pytest.raises(ValueError, match="non-finite values"):
+        calc.energies(frames)
+
+
+def test_batch_linear_energies_reject_feature_length_mismatch() -> None:
+    from anisoap_ase import LinearModel
+
+    calc = AniSOAPCalculator(
+        model=LinearModel(np.array([1.0, 2.0])), descriptor=position_descriptor
+    )
+    frames = [Atoms("H", positions=[[0.0, 0.0, 0.0]]) for _ in range(2)]
+    with pytest.raises(ValueError, match="feature matrix"):
+        calc.energies(frames)
+
+
+def test_calculate_batch_uses_single_batched_descriptor_call() -> None:
+    calls = 0
+
+    class BatchDescriptor:
+        def __call__(self, atoms: Atoms) -> np.ndarray:
+            return atoms.get_positions().reshape(-1)
+
+        def compute_batch(self, frames: list[Atoms]) -> np.ndarray:
+            nonlocal calls
+            calls += 1
+            return np.vstack([self(frame) for frame in frames])
+
+    frames = [Atoms("H", positions=[[float(i), 0.0, 0.0]]) for i in range(4)]
+    calc = AniSOAPCalculator(model=harmonic_energy, descriptor=BatchDescriptor())
+    results = calc.calculate_batch(frames)
+    assert calls == 1
+    assert [entry["energy"] for entry in results] == pytest.approx(
+        [0.0, 0.5, 2.0, 4.5]
+    )
+
+
+def test_threaded_energies_match_serial_evaluation() -> None:
+    frames = [Atoms("H", positions=[[float(i), -1.0, 0.5]]) for i in range(7)]
+    serial = AniSOAPCalculator(model=harmonic_energy, descriptor=position_descriptor)
+    threaded = AniSOAPCalculator(
+        model=harmonic_energy, descriptor=position_descriptor, max_workers=3
+    )
+    np.testing.assert_allclose(threaded.energies(frames), serial.energies(frames))
+
+
+def test_max_workers_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        AniSOAPCalculator(
+            model=harmonic_energy, descriptor=position_descriptor, max_workers=0
+        )
+
+
+def test_calculate_batch_forces_share_one_perturbation_call() -> None:
+    calls = 0
+
+    class BatchDescriptor:
+        def __call__(self, atoms: Atoms) -> np.ndarray:
+            return atoms.get_positions().reshape(-1)
+
+        def compute_batch(self, frames: list[Atoms]) -> np.ndarray:
+            nonlocal calls
+            calls += 1
+            return np.vstack([self(frame) for frame in frames])
+
+    frames = [
+        Atoms("H2", positions=[[1.0, -0.5, 0.25], [-0.2, 0.4, 0.8]]),
+        Atoms("H2", positions=[[0.3, 0.1, -0.6], [0.9, -0.7, 0.2]]),
+    ]
+    calc = AniSOAPCalculator(
+        model=harmonic_energy,
+        descriptor=BatchDescriptor(),
+        force_method="central",
+        finite_difference_step=1e-6,
+    )
+    results = calc.calculate_batch(frames, properties=("energy", "forces"))
+    # One batched call for energies, one for all frames' perturbations.
+    assert calls == 2
+    for atoms, frame_results in zip(frames, results, strict=True):
+        np.testing.assert_allclose(
+            frame_results["forces"], -atoms.positions, atol=1e-7
+        )
+
+
+def test_calculate_batch_rejects_inconsistent_feature_lengths() -> None:
+    frames = [
+        Atoms("H", positions=[[0.0, 0.0, 0.0]]),
+        Atoms("H2", positions=[[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]]),
+    ]
+    calc = AniSOAPCalculator(model=harmonic_energy, descriptor=position_descriptor)
+    with pytest.raises(ValueError, match="inconsistent"):
+        calc.calculate_batch(frames)
+
+
+def test_descriptor_cache_skips_recomputation_for_equal_geometries() -> None:
+    calls = 0
+
+    def descriptor(atoms: Atoms) -> np.ndarray:
+        nonlocal calls
+        calls += 1
+        return atoms.get_positions().reshape(-1)
+
+    calc = AniSOAPCalculator(
+        model=harmonic_energy, descriptor=descriptor, descriptor_cache_size=4
+    )
+    first = Atoms("H", positions=[[0.1, 0.2, 0.3]])
+    duplicate = Atoms("H", positions=[[0.1, 0.2, 0.3]])
+    moved = Atoms("H", positions=[[0.4, 0.2, 0.3]])
+
+    calc.calculate(first, properties=["energy"])
+    calc.calculate(duplicate, properties=["energy"])
+    assert calls == 1
+    calc.calculate(moved, properties=["energy"])
+    assert calls == 2
+
+
+def test_cached_features_are_read_only() -> None:
+    def mutating_model(features: np.ndarray) -> float:
+        energy = 0.5 * float(features @ features)
+        features *= 0.0
+        return energy
+
+    atoms = Atoms("H", positions=[[1.0, 2.0, 3.0]])
+    calc = AniSOAPCalculator(
+        model=mutating_model,
+        descriptor=position_descriptor,
+        descriptor_cache_size=4,
+    )
+    with pytest.raises(ValueError, match="read-only"):
+        calc.calculate(atoms, properties=["energy"])
+
+
+def test_descriptor_cache_is_bounded() -> None:
+    calls = 0
+
+    def descriptor(atoms: Atoms) -> np.ndarray:
+        nonlocal calls
+        calls += 1
+        return atoms.get_positions().reshape(-1)
+
+    calc = AniSOAPCalculator(
+        model=harmonic_energy, descriptor=descriptor, descriptor_cache_size=1
+    )
+    one = Atoms("H", positions=[[1.0, 0.0, 0.0]])
+    two = Atoms("H", positions=[[2.0, 0.0, 0.0]])
+    calc.calculate(one, properties=["energy"])
+    calc.calculate(two, properties=["energy"])
+    calc.calculate(one.copy(), properties=["energy"])
+    assert calls == 3
+
+
 def test_model_must_return_one_scalar() -> None:
     atoms = Atoms("H", positions=[[0.0, 0.0, 0.0]])
     atoms.calc = AniSOAPCalculator(
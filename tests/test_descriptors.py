@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import sys
+import types
+
 import numpy as np
 import pytest
 from ase import Atoms
 
+import anisoap_ase.descriptors as descriptors_module
 from anisoap_ase import AniSOAPDescriptor
 
 
@@ -38,6 +42,33 @@ def test_defaults_preserve_supplied_diameters() -> None:
     np.testing.assert_allclose(prepared.arrays["c_diameter[3]"], 0.5)
 
 
+def test_default_diameter_buffers_are_reused_across_calls() -> None:
+    descriptor = AniSOAPDescriptor(default_diameters=(4.0, 4.0, 0.5))
+    first = descriptor.prepare_atoms(oriented_atoms())
+    second = descriptor.prepare_atoms(oriented_atoms())
+    shared = first.arrays["c_diameter[1]"]
+    assert shared is second.arrays["c_diameter[1]"]
+    assert not shared.flags.writeable
+
+
+def test_validate_once_skips_value_checks_for_seen_structures() -> None:
+    descriptor = AniSOAPDescriptor(
+        default_diameters=(1.0, 1.0, 1.0), validate_once=True
+    )
+    atoms = oriented_atoms()
+    descriptor.prepare_atoms(atoms)
+
+    # Corrupting the quaternions after the first pass is not caught again
+    # for the same object; a fresh object is fully validated.
+    atoms.arrays["c_q"][0] = 0.0
+    descriptor.prepare_atoms(atoms)
+
+    fresh = oriented_atoms()
+    fresh.arrays["c_q"][0] = 0.0
+    with pytest.raises(ValueError, match="zero quaternion"):
+        descriptor.prepare_atoms(fresh)
+
+
 def test_missing_orientation_is_reported() -> None:
     atoms = Atoms("H", positions=[[0.0, 0.0, 0.0]])
     descriptor = AniSOAPDescriptor(default_diameters=(1.0, 1.0, 1.0))
@@ -59,6 +90,69 @@ def test_invalid_quaternion_shape_is_reported() -> None:
         descriptor.prepare_atoms(atoms)
 
 
+def test_identical_hypers_share_one_projection(monkeypatch) -> None:
+    constructed = []
+
+    class FakeProjection:
+        def __init__(self, **hypers) -> None:
+            constructed.append(hypers)
+
+    representations = types.ModuleType("anisoap.representations")
+    representations.EllipsoidalDensityProjection = FakeProjection
+    package = types.ModuleType("anisoap")
+    package.representations = representations
+    monkeypatch.setitem(sys.modules, "anisoap", package)
+    monkeypatch.setitem(sys.modules, "anisoap.representations", representations)
+    monkeypatch.setattr(descriptors_module, "_projection_cache", {})
+
+    first = AniSOAPDescriptor()
+    second = AniSOAPDescriptor()
+    assert first._get_projection() is second._get_projection()
+    assert len(constructed) == 1
+    # The lock serializing backend calls is shared along with the projection.
+    assert first._projection_use_lock is second._projection_use_lock
+
+
+def test_shared_projection_calls_are_serialized(monkeypatch) -> None:
+    import threading
+
+    active = 0
+    overlapped = []
+
+    class FakeProjection:
+        def __init__(self, **hypers) -> None:
+            pass
+
+        def power_spectrum(self, frames):
+            nonlocal active
+            active += 1
+            overlapped.append(active > 1)
+            import time
+
+            time.sleep(0.005)
+            active -= 1
+            return np.ones((len(frames), 2))
+
+    representations = types.ModuleType("anisoap.representations")
+    representations.EllipsoidalDensityProjection = FakeProjection
+    package = types.ModuleType("anisoap")
+    package.representations = representations
+    monkeypatch.setitem(sys.modules, "anisoap", package)
+    monkeypatch.setitem(sys.modules, "anisoap.representations", representations)
+    monkeypatch.setattr(descriptors_module, "_projection_cache", {})
+
+    descriptor = AniSOAPDescriptor(default_diameters=(1.0, 1.0, 1.0))
+    threads = [
+        threading.Thread(target=descriptor.compute_batch, args=([oriented_atoms()],))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not any(overlapped)
+
+
 def test_nonpositive_diameter_is_rejected() -> None:
     atoms = oriented_atoms()
     atoms.set_array("c_diameter[1]", np.ones(2))
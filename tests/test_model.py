@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from anisoap_ase import LinearModel
+from anisoap_ase.model import clear_model_cache
 
 
 def test_linear_model_round_trip(tmp_path) -> None:
@@ -18,3 +19,48 @@ def test_linear_model_rejects_feature_length_mismatch() -> None:
     model = LinearModel(np.array([1.0, 2.0]))
     with pytest.raises(ValueError, match="Feature length"):
         model(np.array([1.0]))
+
+
+def test_repeated_loads_share_one_model(tmp_path) -> None:
+    path = tmp_path / "model.npz"
+    LinearModel(np.array([1.0, 2.0]), intercept=0.5).save(path)
+    first = LinearModel.load(path)
+    assert LinearModel.load(path) is first
+
+    clear_model_cache()
+    assert LinearModel.load(path) is not first
+
+
+def test_loaded_model_coefficients_are_read_only(tmp_path) -> None:
+    path = tmp_path / "model.npz"
+    LinearModel(np.array([1.0, 2.0])).save(path)
+    model = LinearModel.load(path)
+    assert not model.coefficients.flags.writeable
+    with pytest.raises(ValueError):
+        model.coefficients[0] = 99.0
+
+
+def test_rewritten_model_file_is_reloaded(tmp_path) -> None:
+    import os
+
+    path = tmp_path / "model.npz"
+    LinearModel(np.array([1.0])).save(path)
+    stale = LinearModel.load(path)
+    LinearModel(np.array([3.0])).save(path)
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+    fresh = LinearModel.load(path)
+    assert fresh is not stale
+    assert fresh(np.array([1.0])) == pytest.approx(3.0)
+
+
+def test_evaluate_batch_matches_per_frame_calls() -> None:
+    model = LinearModel(np.array([1.0, -2.0, 0.5]), intercept=1.0)
+    features = np.array([[1.0, 0.0, 2.0], [0.0, 3.0, 0.0]])
+    expected = [model(row) for row in features]
+    np.testing.assert_allclose(model.evaluate_batch(features), expected)
+
+
+def test_evaluate_batch_rejects_wrong_shape() -> None:
+    model = LinearModel(np.array([1.0, 2.0]))
+    with pytest.raises(ValueError, match="feature matrix"):
+        model.evaluate_batch(np.ones((2, 3)))